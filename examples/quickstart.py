@@ -14,7 +14,6 @@ Run this file to verify your installation:
 
 from __future__ import annotations
 
-import json
 import tempfile
 from pathlib import Path
 
@@ -44,14 +43,13 @@ def demo_basic_study() -> None:
         Component(name="query_rewriter"),
     ]
 
-    study = AblationStudy()
-    config = study.configure(components=components, metrics=["accuracy", "latency_ms"])
+    config = AblationStudy.configure(components=components, metrics=["accuracy", "latency_ms"])
 
     print(f"Configured study with {len(config.base_components)} components")
     print(f"Metrics to track: {config.metrics_to_track}")
 
     # Generate run plan
-    runs = study.generate_runs(config)
+    runs = AblationStudy.generate_runs(config)
     print(f"\nGenerated {len(runs)} runs:")
     for run in runs:
         label = f"(baseline)" if run.disabled_component is None else f"(ablate {run.disabled_component})"
@@ -69,7 +67,7 @@ def demo_basic_study() -> None:
 
     # Analyse
     result = AblationResult(config=config, runs=runs)
-    ranking = study.rank_components(result)
+    ranking = AblationStudy.rank_components(result)
 
     print("\nComponent importance ranking (higher = more important):")
     for rank, (name, score) in enumerate(ranking, start=1):
@@ -94,9 +92,8 @@ def demo_harmful_component() -> None:
         Component(name="answer_generator"),
     ]
 
-    study = AblationStudy()
-    config = study.configure(components=components, metrics=["accuracy"])
-    runs = study.generate_runs(config)
+    config = AblationStudy.configure(components=components, metrics=["accuracy"])
+    runs = AblationStudy.generate_runs(config)
 
     # The noise_filter is actually hurting accuracy
     runs[0].metrics = {"accuracy": 0.72}  # baseline (includes the harmful filter)
@@ -105,7 +102,7 @@ def demo_harmful_component() -> None:
     runs[3].metrics = {"accuracy": 0.70}  # answer_generator removed — small drop
 
     result = AblationResult(config=config, runs=runs)
-    importance = study.compute_importance(result)
+    importance = AblationStudy.compute_importance(result)
 
     print("\nImportance scores:")
     for name, score in sorted(importance.items(), key=lambda x: x[1], reverse=True):
@@ -130,44 +127,31 @@ def demo_json_roundtrip() -> None:
     print("=" * 60)
 
     components = [Component(name="embedder"), Component(name="ranker")]
-    study = AblationStudy()
-    config = study.configure(components=components, metrics=["score"])
-    runs = study.generate_runs(config)
-
-    # Simulate the configure command output
-    output_data = {
-        "config": config.model_dump(),
-        "runs": [r.model_dump() for r in runs],
-    }
-
-    with tempfile.NamedTemporaryFile(
-        mode="w", suffix=".json", delete=False, encoding="utf-8"
-    ) as tmp:
-        json.dump(output_data, tmp, indent=2)
-        tmp_path = tmp.name
-
-    print(f"Config written to temporary file: {tmp_path}")
-
-    # Simulate filling in metrics (as a user would edit the JSON)
-    loaded = json.loads(Path(tmp_path).read_text(encoding="utf-8"))
-    loaded["runs"][0]["metrics"] = {"score": 0.90}
-    loaded["runs"][1]["metrics"] = {"score": 0.75}
-    loaded["runs"][2]["metrics"] = {"score": 0.85}
-    Path(tmp_path).write_text(json.dumps(loaded, indent=2), encoding="utf-8")
-
-    # Load back and analyze
-    data = json.loads(Path(tmp_path).read_text(encoding="utf-8"))
-    loaded_config = AblationConfig.model_validate(data["config"])
-    loaded_runs = [AblationRun.model_validate(r) for r in data["runs"]]
-
-    result = AblationResult(config=loaded_config, runs=loaded_runs)
-    ranking = study.rank_components(result)
+    config = AblationStudy.configure(components=components, metrics=["score"])
+    runs = AblationStudy.generate_runs(config)
+
+    # Fill in metrics in memory — your harness would do this after evaluating
+    for run, score in zip(runs, [0.90, 0.75, 0.85]):
+        run.metrics = {"score": score}
+
+    # Write the study once; Pydantic serialises straight to JSON
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as tmp:
+        tmp_path = Path(tmp.name)
+    tmp_path.write_text(
+        AblationResult(config=config, runs=runs).model_dump_json(indent=2),
+        encoding="utf-8",
+    )
+    print(f"Results written to temporary file: {tmp_path}")
+
+    # Load back and analyze — validated directly from the JSON bytes
+    result = AblationResult.model_validate_json(tmp_path.read_bytes())
+    ranking = AblationStudy.rank_components(result)
 
     print("Ranking from reloaded data:")
     for name, score in ranking:
         print(f"  {name}: {score:+.4f}")
 
-    Path(tmp_path).unlink(missing_ok=True)
+    tmp_path.unlink(missing_ok=True)
 
 
 # ---------------------------------------------------------------------------
@@ -182,15 +166,14 @@ def demo_repetitions() -> None:
     print("=" * 60)
 
     components = [Component(name="sampler"), Component(name="scorer")]
-    study = AblationStudy()
-    config = study.configure(components=components, metrics=["quality"])
+    config = AblationStudy.configure(components=components, metrics=["quality"])
     config.repetitions = 5
 
     print(f"Repetitions configured: {config.repetitions}")
     print("(Your evaluation harness should run each configuration 5 times")
     print(" and store the average in run.metrics before calling analyze.)")
 
-    runs = study.generate_runs(config)
+    runs = AblationStudy.generate_runs(config)
     print(f"Run IDs generated ({len(runs)} runs):")
     for run in runs:
         print(f"  {run.run_id}")
@@ -230,8 +213,7 @@ def demo_manual_runs() -> None:
     )
 
     result = AblationResult(config=config, runs=[baseline, ablate_both])
-    study = AblationStudy()
-    importance = study.compute_importance(result)
+    importance = AblationStudy.compute_importance(result)
     print(f"Importance when both a and b are removed: {importance}")
 
 
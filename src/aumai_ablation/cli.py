@@ -1,23 +1,85 @@
 """CLI entry point for aumai-ablation.
 
 Commands:
-  configure   Set up an ablation study from a components YAML file.
+  configure   Set up an ablation study from a components YAML or JSON file.
   analyze     Analyze ablation results from a JSONL file.
 """
 
 from __future__ import annotations
 
+import importlib
 import json
-import sys
+import math
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
 import click
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from aumai_ablation.core import AblationStudy
 from aumai_ablation.models import AblationConfig, AblationResult, AblationRun, Component
 
-__all__ = ["cli"]
+_orjson: ModuleType | None
+try:
+    _orjson = importlib.import_module("orjson")
+except ImportError:  # pragma: no cover - orjson is an optional accelerator
+    _orjson = None
+
+__all__ = ["cli", "configure_impl", "analyze_impl"]
+
+_CONFIGURE_INSTRUCTIONS = (
+    "Fill in 'metrics' dict for each run, then use 'analyze' to compute importance."
+)
+
+
+class _ConfigureOutput(BaseModel):
+    """On-disk format written by ``configure`` and accepted by ``analyze``."""
+
+    config: AblationConfig
+    runs: list[AblationRun]
+    instructions: str = ""
+
+
+_MISSING_KEYS_MESSAGE = "JSON file must contain 'config' and 'runs' keys."
+
+_READ_BUFFER_SIZE = 256 * 1024  # large results files are read line by line
+
+_COMPONENTS_ADAPTER = TypeAdapter(list[Component])
+_CONFIGURE_OUTPUT_ADAPTER = TypeAdapter(_ConfigureOutput)
+
+
+def _finite_or_none(obj: Any) -> Any:  # noqa: ANN401
+    """Replace non-finite floats in *obj* with ``None``, as orjson does."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite_or_none(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite_or_none(item) for item in obj]
+    return obj
+
+
+def _dumps(obj: dict[str, Any]) -> bytes:
+    """Serialise *obj* as indented JSON, using orjson when it is installed.
+
+    Non-finite floats such as NaN are written as ``null`` on both paths, so
+    the output is strict JSON whichever serialiser runs.
+    """
+    if _orjson is not None:
+        payload: bytes = _orjson.dumps(obj, option=_orjson.OPT_INDENT_2)
+        return payload
+    return json.dumps(_finite_or_none(obj), indent=2, allow_nan=False).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:  # noqa: ANN401
+    """Parse JSON *data*, using orjson when it is installed.
+
+    Both parsers raise a ``json.JSONDecodeError`` subclass on malformed input.
+    """
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
 
 
 def _load_yaml_components(path: str) -> list[Component]:
@@ -35,14 +97,194 @@ def _load_yaml_components(path: str) -> list[Component]:
     try:
         import yaml  # type: ignore[import-untyped]
     except ImportError:
-        click.echo("Error: PyYAML is required. Install with: pip install pyyaml", err=True)
-        sys.exit(1)
+        raise click.ClickException(
+            "PyYAML is required. Install with: pip install pyyaml"
+        ) from None
+
+    # Prefer the libyaml-backed loader; fall back to pure Python when PyYAML
+    # was built without it.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    raw = yaml.load(Path(path).read_text(encoding="utf-8"), Loader=loader)  # noqa: S506
+    if not isinstance(raw, list):
+        raise click.ClickException(
+            "components YAML must be a list of component objects."
+        )
+    return _COMPONENTS_ADAPTER.validate_python(raw)
+
+
+def _load_components(path: str) -> list[Component]:
+    """Load components from a ``.json`` file or, otherwise, a YAML file.
 
-    raw = yaml.safe_load(Path(path).read_text(encoding="utf-8"))
+    JSON manifests use the same list-of-objects layout as YAML and are parsed
+    without PyYAML, which is much faster for large, machine-generated files.
+    """
+    if Path(path).suffix.lower() != ".json":
+        return _load_yaml_components(path)
+
+    raw = _loads(Path(path).read_bytes())
     if not isinstance(raw, list):
-        click.echo("Error: components YAML must be a list of component objects.", err=True)
-        sys.exit(1)
-    return [Component.model_validate(item) for item in raw]
+        raise click.ClickException(
+            "components JSON must be a list of component objects."
+        )
+    return _COMPONENTS_ADAPTER.validate_python(raw)
+
+
+def _validate_document(data: bytes) -> _ConfigureOutput:
+    """Validate a multi-line ``configure`` document, reporting missing keys."""
+    try:
+        return _ConfigureOutput.model_validate_json(data)
+    except ValidationError as exc:
+        if any(
+            err["type"] in ("missing", "model_type") and len(err["loc"]) <= 1
+            for err in exc.errors()
+        ):
+            raise click.ClickException(_MISSING_KEYS_MESSAGE) from None
+        raise
+
+
+def _load_results(path: str) -> tuple[AblationConfig | None, list[AblationRun]]:
+    """Load runs (and the config, if present) from a JSON or JSONL results file.
+
+    The first non-blank line decides the format: a complete run object starts
+    JSONL, which is streamed line by line rather than read into memory whole.
+    A one-line object with a ``config`` or ``runs`` key is a compact
+    ``configure`` document (which must carry both keys), and an incomplete
+    line starting with ``{`` opens a multi-line one.  The file is read in
+    binary mode; Pydantic validates each line straight from the UTF-8 bytes.
+    """
+    with open(path, "rb", buffering=_READ_BUFFER_SIZE) as fh:
+        first_line = next((line for line in fh if line.strip()), b"")
+        if not first_line:
+            return None, []
+
+        try:
+            first_run = AblationRun.model_validate_json(first_line)
+        except ValidationError:
+            # Not a run: it may still be a configure document.
+            try:
+                first: Any = json.loads(first_line)
+            except json.JSONDecodeError:
+                if not first_line.lstrip().startswith(b"{"):
+                    raise
+                document = _validate_document(first_line + fh.read())
+                return document.config, document.runs
+            if not (isinstance(first, dict) and ("config" in first or "runs" in first)):
+                raise
+            if not {"config", "runs"} <= first.keys():
+                raise click.ClickException(_MISSING_KEYS_MESSAGE) from None
+            document = _ConfigureOutput.model_validate(first)
+            return document.config, document.runs
+
+        runs = [first_run]
+        runs.extend(
+            AblationRun.model_validate_json(line) for line in fh if line.strip()
+        )
+    return None, runs
+
+
+def configure_impl(
+    components_path: str,
+    metrics_str: str,
+    output_path: str,
+    repetitions: int = 1,
+) -> list[AblationRun]:
+    """Build an ablation study and write its run templates to *output_path*.
+
+    This is the body of the ``configure`` command, callable without Click.
+
+    Args:
+        components_path: Path to the components YAML or JSON file.
+        metrics_str: Comma-separated metric names.
+        output_path: Where to write the configure JSON document.
+        repetitions: Number of repetitions per ablation run.
+
+    Returns:
+        The generated runs, in the order they were written.
+
+    Raises:
+        click.BadParameter: If *metrics_str* contains no metric names.
+        click.ClickException: If the components file cannot be loaded.
+    """
+    metrics = [name for m in metrics_str.split(",") if (name := m.strip())]
+    if not metrics:
+        raise click.BadParameter(
+            "must contain at least one metric name.", param_hint="'--metrics'"
+        )
+
+    components = _load_components(components_path)
+
+    config = AblationStudy.configure(components=components, metrics=metrics)
+    config.repetitions = repetitions
+
+    runs = AblationStudy.generate_runs(config)
+
+    output = _ConfigureOutput(
+        config=config, runs=runs, instructions=_CONFIGURE_INSTRUCTIONS
+    )
+    # dump_json returns UTF-8 bytes straight from pydantic-core: no dict mirror
+    # of the models and no str round-trip before hitting the file.
+    Path(output_path).write_bytes(_CONFIGURE_OUTPUT_ADAPTER.dump_json(output, indent=2))
+    return runs
+
+
+def analyze_impl(
+    results_path: str,
+    output_path: str | None = None,
+    config_path: str | None = None,
+) -> bytes:
+    """Rank components from a results file and return the analysis as JSON.
+
+    This is the body of the ``analyze`` command, callable without Click.
+
+    Args:
+        results_path: JSONL results or a JSON document from ``configure``.
+        output_path: If given, the analysis is also written to this path.
+        config_path: Optional separate ``ablation_config.json``.
+
+    Returns:
+        The indented JSON analysis as UTF-8 bytes.
+
+    Raises:
+        click.ClickException: If a JSON results document lacks ``config`` or
+            ``runs``.
+    """
+    config, runs = _load_results(results_path)
+
+    if config is None and config_path is not None:
+        # The stdlib parser accepts the NaN/Infinity that ``configure`` may write.
+        config_data: Any = json.loads(Path(config_path).read_bytes())
+        config = AblationConfig.model_validate(config_data.get("config", config_data))
+
+    if config is None:
+        # Build a minimal config from the runs, keeping first-seen order.
+        # Names come from already-validated components, so skip re-validation.
+        all_component_names: dict[str, None] = {}
+        all_metrics: dict[str, None] = {}
+        for run in runs:
+            all_component_names.update(dict.fromkeys(c.name for c in run.components))
+            all_metrics.update(dict.fromkeys(run.metrics))
+        base_components = [
+            Component.model_construct(name=n) for n in all_component_names
+        ]
+        config = AblationConfig(
+            base_components=base_components,
+            metrics_to_track=list(all_metrics),
+        )
+
+    result = AblationResult(config=config, runs=runs)
+    ranking = AblationStudy.rank_components(result)
+
+    output_data = {
+        "component_importance": result.component_importance,
+        "ranking": [
+            {"component": name, "importance": score} for name, score in ranking
+        ],
+    }
+
+    json_output = _dumps(output_data)
+    if output_path:
+        Path(output_path).write_bytes(json_output)
+    return json_output
 
 
 @click.group()
@@ -57,7 +299,7 @@ def cli() -> None:
     "components_path",
     required=True,
     type=click.Path(exists=True, dir_okay=False, readable=True),
-    help="Path to a YAML file listing components.",
+    help="Path to a YAML (or .json) file listing components.",
 )
 @click.option(
     "--metrics",
@@ -93,31 +335,8 @@ def configure_command(
     \b
         aumai-ablation configure --components comp.yaml --metrics accuracy,latency
     """
-    components = _load_yaml_components(components_path)
-    metrics = [m.strip() for m in metrics_str.split(",") if m.strip()]
-
-    if not metrics:
-        click.echo("Error: --metrics must contain at least one metric name.", err=True)
-        sys.exit(1)
-
-    study = AblationStudy()
-    config = study.configure(components=components, metrics=metrics)
-    config.repetitions = repetitions
-
-    runs = study.generate_runs(config)
-
-    output = {
-        "config": config.model_dump(),
-        "runs": [r.model_dump() for r in runs],
-        "instructions": (
-            "Fill in 'metrics' dict for each run, then use 'analyze' to compute importance."
-        ),
-    }
-
-    Path(output_path).write_text(json.dumps(output, indent=2), encoding="utf-8")
-    click.echo(
-        f"Ablation config with {len(runs)} runs written to {output_path}"
-    )
+    runs = configure_impl(components_path, metrics_str, output_path, repetitions)
+    click.echo(f"Ablation config with {len(runs)} runs written to {output_path}")
 
 
 @cli.command("analyze")
@@ -160,70 +379,11 @@ def analyze_command(
     \b
         aumai-ablation analyze --results results.jsonl
     """
-    raw_text = Path(results_path).read_text(encoding="utf-8").strip()
-
-    # Try to parse as JSON first (configure output format)
-    runs: list[AblationRun] = []
-    config: AblationConfig | None = None
-
-    parsed_as_json = False
-    if raw_text.startswith("{"):
-        try:
-            data: Any = json.loads(raw_text)
-            if "config" in data and "runs" in data:
-                config = AblationConfig.model_validate(data["config"])
-                runs = [AblationRun.model_validate(r) for r in data["runs"]]
-                parsed_as_json = True
-            else:
-                click.echo("Error: JSON file must contain 'config' and 'runs' keys.", err=True)
-                sys.exit(1)
-        except json.JSONDecodeError:
-            pass  # Fall through to JSONL parsing
-
-    if not parsed_as_json:
-        # JSONL format
-        for line in raw_text.splitlines():
-            line = line.strip()
-            if line:
-                line_data: Any = json.loads(line)
-                runs.append(AblationRun.model_validate(line_data))
-
-    if config is None and config_path is not None:
-        config_data: Any = json.loads(Path(config_path).read_text(encoding="utf-8"))
-        config = AblationConfig.model_validate(
-            config_data.get("config", config_data)
-        )
-
-    if config is None:
-        # Build a minimal config from the runs
-        all_component_names: set[str] = set()
-        for run in runs:
-            for comp in run.components:
-                all_component_names.add(comp.name)
-        base_components = [Component(name=n) for n in sorted(all_component_names)]
-        all_metrics: set[str] = set()
-        for run in runs:
-            all_metrics.update(run.metrics.keys())
-        config = AblationConfig(
-            base_components=base_components,
-            metrics_to_track=sorted(all_metrics),
-        )
-
-    result = AblationResult(config=config, runs=runs)
-    study = AblationStudy()
-    ranking = study.rank_components(result)
-
-    output_data = {
-        "component_importance": result.component_importance,
-        "ranking": [{"component": name, "importance": score} for name, score in ranking],
-    }
-
-    json_output = json.dumps(output_data, indent=2)
+    json_output = analyze_impl(results_path, output_path, config_path)
     if output_path:
-        Path(output_path).write_text(json_output, encoding="utf-8")
         click.echo(f"Analysis written to {output_path}")
     else:
-        click.echo(json_output)
+        click.echo(json_output.decode("utf-8"))
 
 
 # Allow both `aumai-ablation` and legacy `main` entry point names
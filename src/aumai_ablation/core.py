@@ -7,8 +7,9 @@ metric values are supplied externally (e.g. by running a real evaluation).
 
 from __future__ import annotations
 
-import copy
-import uuid
+import os
+import statistics
+from operator import itemgetter
 
 from aumai_ablation.models import (
     AblationConfig,
@@ -20,29 +21,46 @@ from aumai_ablation.models import (
 __all__ = ["AblationStudy"]
 
 _BASELINE_RUN_ID_PREFIX = "baseline"
+_RUN_ID_SUFFIX_LEN = 8  # hex chars
+
+
+def _mean_metric(metrics: dict[str, float]) -> float | None:
+    """Return the mean of all metric values, or ``None`` if there are none."""
+    if not metrics:
+        return None
+    return statistics.fmean(metrics.values())
+
+
+def _snapshot(component: Component) -> Component:
+    """Copy *component* for a run, giving it its own top-level ``config`` dict."""
+    return component.model_copy(update={"config": dict(component.config)})
 
 
 class AblationStudy:
     """Ablation study engine for agent component evaluation.
 
     Generates a structured set of runs (one per component plus a baseline),
-    and computes importance scores from observed metric deltas.
+    and computes importance scores from observed metric deltas.  The engine
+    holds no state, so every method is a ``staticmethod`` except
+    ``rank_components``, a ``classmethod`` that honours subclass overrides of
+    ``compute_importance``.  Calling them on an instance
+    (``AblationStudy().generate_runs(...)``) keeps working.
 
     Example::
 
-        study = AblationStudy()
-        config = study.configure(
+        config = AblationStudy.configure(
             components=[Component(name="retriever"), Component(name="reranker")],
             metrics=["accuracy", "latency_ms"],
         )
-        runs = study.generate_runs(config)
+        runs = AblationStudy.generate_runs(config)
         # ... fill in run.metrics from real evaluations ...
         result = AblationResult(config=config, runs=runs)
-        importance = study.compute_importance(result)
-        ranking = study.rank_components(result)
+        importance = cls.compute_importance(result)
+        ranking = AblationStudy.rank_components(result)
     """
 
-    def configure(self, components: list[Component], metrics: list[str]) -> AblationConfig:
+    @staticmethod
+    def configure(components: list[Component], metrics: list[str]) -> AblationConfig:
         """Build an ``AblationConfig`` from a component list and metric names.
 
         Args:
@@ -57,12 +75,17 @@ class AblationStudy:
             metrics_to_track=metrics,
         )
 
-    def generate_runs(self, config: AblationConfig) -> list[AblationRun]:
+    @staticmethod
+    def generate_runs(config: AblationConfig) -> list[AblationRun]:
         """Generate the full set of ablation runs.
 
         Produces one baseline run (all components enabled) plus one run per
         enabled component (that component disabled, all others enabled).
 
+        Every run gets its own ``Component`` instances, each with its own
+        top-level ``config`` dict; nested values inside ``config`` (lists,
+        dicts) are shared with ``config.base_components`` rather than copied.
+
         Args:
             config: The ablation study configuration.
 
@@ -72,29 +95,40 @@ class AblationStudy:
         """
         runs: list[AblationRun] = []
 
+        # One random draw covers the suffix of every run ID in the study.
+        suffixes = os.urandom(
+            (_RUN_ID_SUFFIX_LEN // 2) * (len(config.base_components) + 1)
+        ).hex()
+        step = _RUN_ID_SUFFIX_LEN
+
+        # Components were validated when the config was built, so shallow
+        # ``model_copy`` snapshots are enough — no deepcopy or re-validation.
+        # Ablations flip one flag on a private working list and snapshot it,
+        # then flip the flag back.
+        working = [c.model_copy() for c in config.base_components]
+
         # Baseline — all components enabled
-        baseline_components = [copy.deepcopy(c) for c in config.base_components]
         baseline_run = AblationRun(
-            run_id=f"{_BASELINE_RUN_ID_PREFIX}-{str(uuid.uuid4())[:8]}",
+            run_id=f"{_BASELINE_RUN_ID_PREFIX}-{suffixes[:step]}",
             disabled_component=None,
-            components=baseline_components,
+            components=[_snapshot(c) for c in working],
         )
         runs.append(baseline_run)
 
         # One run per enabled component
-        for component in config.base_components:
+        for index, component in enumerate(working, start=1):
             if not component.enabled:
                 continue  # Skip already-disabled components
 
-            ablated_components: list[Component] = []
-            for comp in config.base_components:
-                ablated = copy.deepcopy(comp)
-                if ablated.name == component.name:
-                    ablated.enabled = False
-                ablated_components.append(ablated)
+            component.enabled = False
+            ablated_components = [_snapshot(c) for c in working]
+            component.enabled = True
 
             run = AblationRun(
-                run_id=f"ablate-{component.name}-{str(uuid.uuid4())[:8]}",
+                run_id=(
+                    f"ablate-{component.name}-"
+                    f"{suffixes[index * step : (index + 1) * step]}"
+                ),
                 disabled_component=component.name,
                 components=ablated_components,
             )
@@ -102,7 +136,8 @@ class AblationStudy:
 
         return runs
 
-    def compute_importance(self, result: AblationResult) -> dict[str, float]:
+    @staticmethod
+    def compute_importance(result: AblationResult) -> dict[str, float]:
         """Compute component importance as performance delta vs. the baseline.
 
         For each ablation run (where one component is disabled), the average
@@ -110,6 +145,10 @@ class AblationStudy:
         means the component *helps* overall performance; negative means it
         *hurts*.  Importance = baseline_avg - ablated_avg.
 
+        Repeated runs of the same configuration (e.g. one run per repetition)
+        are pooled: each side of the delta is the mean of the per-run metric
+        averages over every run of that configuration that has metrics.
+
         Args:
             result: A completed ``AblationResult`` whose ``runs`` have
                     populated ``metrics`` dicts.
@@ -117,36 +156,36 @@ class AblationStudy:
         Returns:
             A dict mapping component name to its importance score.
         """
-        # Find the baseline run
-        baseline_run = next(
-            (r for r in result.runs if r.disabled_component is None), None
-        )
-        if baseline_run is None or not baseline_run.metrics:
-            return {}
-
-        # Average of all metrics in the baseline
-        baseline_avg = (
-            sum(baseline_run.metrics.values()) / len(baseline_run.metrics)
-            if baseline_run.metrics
-            else 0.0
-        )
-
-        importance: dict[str, float] = {}
+        # Single pass: reduce every run to its mean metric value once and
+        # accumulate (sum, count) per configuration.
+        baseline_total = 0.0
+        baseline_count = 0
+        ablated_totals: dict[str, tuple[float, int]] = {}
         for run in result.runs:
+            run_avg = _mean_metric(run.metrics)
             if run.disabled_component is None:
-                continue  # skip baseline
-            if not run.metrics:
-                importance[run.disabled_component] = 0.0
+                if run_avg is not None:
+                    baseline_total += run_avg
+                    baseline_count += 1
                 continue
+            total, count = ablated_totals.get(run.disabled_component, (0.0, 0))
+            if run_avg is not None:
+                total += run_avg
+                count += 1
+            ablated_totals[run.disabled_component] = (total, count)
 
-            ablated_avg = sum(run.metrics.values()) / len(run.metrics)
-            # Higher importance = bigger drop when component is removed
-            delta = baseline_avg - ablated_avg
-            importance[run.disabled_component] = round(delta, 6)
+        if not baseline_count:
+            return {}
+        baseline_avg = baseline_total / baseline_count
 
-        return importance
+        # Higher importance = bigger drop when component is removed
+        return {
+            component_name: (round(baseline_avg - total / count, 6) if count else 0.0)
+            for component_name, (total, count) in ablated_totals.items()
+        }
 
-    def rank_components(self, result: AblationResult) -> list[tuple[str, float]]:
+    @classmethod
+    def rank_components(cls, result: AblationResult) -> list[tuple[str, float]]:
         """Rank components from most to least important.
 
         Populates ``result.component_importance`` as a side effect and returns
@@ -158,6 +197,6 @@ class AblationStudy:
         Returns:
             Descending-sorted list of ``(component_name, importance_score)``.
         """
-        importance = self.compute_importance(result)
+        importance = cls.compute_importance(result)
         result.component_importance = importance
-        return sorted(importance.items(), key=lambda x: x[1], reverse=True)
+        return sorted(importance.items(), key=itemgetter(1), reverse=True)
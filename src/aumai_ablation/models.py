@@ -29,9 +29,12 @@ class Component(BaseModel):
     Example::
 
         c = Component(name="retriever", enabled=True, config={"top_k": 5})
+
+    Fields are validated on construction only; attribute assignment (e.g.
+    toggling ``enabled``) is not re-validated.
     """
 
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True)
+    model_config = ConfigDict(str_strip_whitespace=True)
 
     name: str = Field(min_length=1, max_length=128)
     enabled: bool = Field(default=True)
@@ -48,6 +51,9 @@ class AblationConfig(BaseModel):
             metrics_to_track=["accuracy", "latency_ms"],
             repetitions=3,
         )
+
+    ``base_components`` is treated as read-only once the config is built;
+    mutating it in place after construction is unsupported.
     """
 
     model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True)
@@ -78,9 +84,12 @@ class AblationRun(BaseModel):
             components=[Component(name="retriever", enabled=False)],
             metrics={"accuracy": 0.72, "latency_ms": 120.0},
         )
+
+    Fields are validated on construction only, so evaluation harnesses can
+    assign ``run.metrics`` repeatedly without re-running validation.
     """
 
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True)
+    model_config = ConfigDict(str_strip_whitespace=True)
 
     run_id: str = Field(min_length=1)
     disabled_component: str | None = Field(
@@ -101,9 +110,12 @@ class AblationResult(BaseModel):
             runs=[baseline_run, run_a, run_b],
             component_importance={"retriever": 0.15, "reranker": 0.08},
         )
+
+    Fields are validated on construction only; ``component_importance`` is
+    assigned by ``AblationStudy.rank_components`` from trusted code.
     """
 
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True)
+    model_config = ConfigDict(str_strip_whitespace=True)
 
     config: AblationConfig
     runs: list[AblationRun] = Field(default_factory=list)
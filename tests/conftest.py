@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
+from click.testing import CliRunner
 
+from aumai_ablation.cli import configure_impl
 from aumai_ablation.models import AblationConfig, AblationResult, AblationRun, Component
 
 
@@ -60,3 +64,26 @@ SAMPLE_YAML_COMPONENTS = """\
 - name: reranker
   enabled: true
 """
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def components_yaml(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("ablation") / "components.yaml"
+    path.write_text(SAMPLE_YAML_COMPONENTS, encoding="utf-8")
+    return path
+
+
+@pytest.fixture(scope="session")
+def config_json(tmp_path_factory: pytest.TempPathFactory, components_yaml: Path) -> Path:
+    """Create a configure output JSON file once for the analyze tests.
+
+    The file is shared across the session; tests that edit it must work on a copy.
+    """
+    output_path = tmp_path_factory.mktemp("ablation") / "ablation_config.json"
+    configure_impl(str(components_yaml), "accuracy,latency_ms", str(output_path))
+    return output_path
@@ -3,67 +3,40 @@
 from __future__ import annotations
 
 import json
+import shutil
 from pathlib import Path
 
+import click
 import pytest
 from click.testing import CliRunner
 
 # pyyaml is an optional dependency for the configure command
 yaml = pytest.importorskip("yaml", reason="pyyaml is required for ablation CLI tests")
 
-from aumai_ablation.cli import cli
+from aumai_ablation.cli import analyze_impl, cli, configure_impl
 
 
-SAMPLE_YAML_COMPONENTS = """\
-- name: retriever
-  enabled: true
-  config:
-    top_k: 5
-- name: reranker
-  enabled: true
-"""
+_DECODER = json.JSONDecoder()
 
 
 def _extract_json(text: str) -> dict:
-    start = text.index("{")
-    depth = 0
-    for i, ch in enumerate(text[start:], start):
-        if ch == "{":
-            depth += 1
-        elif ch == "}":
-            depth -= 1
-            if depth == 0:
-                return json.loads(text[start : i + 1])
-    raise ValueError("No JSON object found")
-
-
-@pytest.fixture()
-def runner() -> CliRunner:
-    return CliRunner()
-
-
-@pytest.fixture()
-def components_yaml(tmp_path: Path) -> Path:
-    path = tmp_path / "components.yaml"
-    path.write_text(SAMPLE_YAML_COMPONENTS, encoding="utf-8")
-    return path
+    obj, _end = _DECODER.raw_decode(text, text.index("{"))
+    return obj
 
 
-@pytest.fixture()
-def config_json(tmp_path: Path, components_yaml: Path, runner: CliRunner) -> Path:
-    """Create a configure output JSON file for use in analyze tests."""
-    output_path = tmp_path / "ablation_config.json"
-    result = runner.invoke(
-        cli,
-        [
-            "configure",
-            "--components", str(components_yaml),
-            "--metrics", "accuracy,latency_ms",
-            "--output", str(output_path),
-        ],
+@pytest.fixture(scope="session")
+def components_json(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("ablation") / "components.json"
+    path.write_text(
+        json.dumps(
+            [
+                {"name": "retriever", "enabled": True, "config": {"top_k": 5}},
+                {"name": "reranker", "enabled": True},
+            ]
+        ),
+        encoding="utf-8",
     )
-    assert result.exit_code == 0, result.output
-    return output_path
+    return path
 
 
 class TestCLIGroup:
@@ -77,27 +50,41 @@ class TestCLIGroup:
 
 
 class TestConfigureCommand:
+    @pytest.mark.parametrize("components_fixture", ["components_yaml", "components_json"])
     def test_configure_basic(
-        self, runner: CliRunner, components_yaml: Path, tmp_path: Path
+        self,
+        runner: CliRunner,
+        components_fixture: str,
+        tmp_path: Path,
+        request: pytest.FixtureRequest,
     ) -> None:
+        components_path: Path = request.getfixturevalue(components_fixture)
         output_path = tmp_path / "config.json"
         result = runner.invoke(
             cli,
             [
                 "configure",
-                "--components", str(components_yaml),
+                "--components", str(components_path),
                 "--metrics", "accuracy,latency_ms",
                 "--output", str(output_path),
             ],
         )
         assert result.exit_code == 0, result.output
-        assert output_path.exists()
+        data = json.loads(output_path.read_bytes())
+        assert data["config"]["base_components"][0]["config"] == {"top_k": 5}
+        assert len(data["runs"]) == 3
 
-    def test_configure_creates_runs(
-        self, runner: CliRunner, components_yaml: Path, tmp_path: Path
+    def test_configure_without_libyaml(
+        self,
+        runner: CliRunner,
+        components_yaml: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
+        # Falls back to the pure-Python SafeLoader when libyaml is unavailable
+        monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
         output_path = tmp_path / "config.json"
-        runner.invoke(
+        result = runner.invoke(
             cli,
             [
                 "configure",
@@ -106,6 +93,15 @@ class TestConfigureCommand:
                 "--output", str(output_path),
             ],
         )
+        assert result.exit_code == 0, result.output
+        data = json.loads(output_path.read_text(encoding="utf-8"))
+        assert data["config"]["base_components"][0]["config"] == {"top_k": 5}
+
+    def test_configure_creates_runs(
+        self, components_yaml: Path, tmp_path: Path
+    ) -> None:
+        output_path = tmp_path / "config.json"
+        configure_impl(str(components_yaml), "accuracy", str(output_path))
         data = json.loads(output_path.read_text(encoding="utf-8"))
         assert "config" in data
         assert "runs" in data
@@ -113,35 +109,20 @@ class TestConfigureCommand:
         assert len(data["runs"]) == 3
 
     def test_configure_baseline_run_present(
-        self, runner: CliRunner, components_yaml: Path, tmp_path: Path
+        self, components_yaml: Path, tmp_path: Path
     ) -> None:
         output_path = tmp_path / "config.json"
-        runner.invoke(
-            cli,
-            [
-                "configure",
-                "--components", str(components_yaml),
-                "--metrics", "accuracy",
-                "--output", str(output_path),
-            ],
-        )
+        configure_impl(str(components_yaml), "accuracy", str(output_path))
         data = json.loads(output_path.read_text(encoding="utf-8"))
         baseline_runs = [r for r in data["runs"] if r["disabled_component"] is None]
         assert len(baseline_runs) == 1
 
     def test_configure_repetitions_flag(
-        self, runner: CliRunner, components_yaml: Path, tmp_path: Path
+        self, components_yaml: Path, tmp_path: Path
     ) -> None:
         output_path = tmp_path / "config.json"
-        runner.invoke(
-            cli,
-            [
-                "configure",
-                "--components", str(components_yaml),
-                "--metrics", "accuracy",
-                "--repetitions", "3",
-                "--output", str(output_path),
-            ],
+        configure_impl(
+            str(components_yaml), "accuracy", str(output_path), repetitions=3
         )
         data = json.loads(output_path.read_text(encoding="utf-8"))
         assert data["config"]["repetitions"] == 3
@@ -173,6 +154,8 @@ class TestConfigureCommand:
             ],
         )
         assert result.exit_code != 0
+        assert "at least one metric name" in result.output
+        assert not output_path.exists()
 
 
 class TestAnalyzeCommand:
@@ -180,7 +163,8 @@ class TestAnalyzeCommand:
         self, runner: CliRunner, config_json: Path, tmp_path: Path
     ) -> None:
         """Fill in metrics in config JSON then analyze."""
-        data = json.loads(config_json.read_text(encoding="utf-8"))
+        config_json = Path(shutil.copy(config_json, tmp_path / "cfg.json"))
+        data = json.loads(config_json.read_bytes())
         for run in data["runs"]:
             if run["disabled_component"] is None:
                 run["metrics"] = {"accuracy": 0.90, "latency_ms": 100.0}
@@ -198,6 +182,27 @@ class TestAnalyzeCommand:
         assert "ranking" in output
         assert "component_importance" in output
 
+    def test_analyze_json_multiline_without_lone_brace(
+        self, runner: CliRunner, config_json: Path, tmp_path: Path
+    ) -> None:
+        """A document whose first line opens the object inline still loads."""
+        data = json.loads(config_json.read_bytes())
+        for run in data["runs"]:
+            drop = 0.2 if run["disabled_component"] == "retriever" else 0.0
+            run["metrics"] = {"accuracy": 0.9 - drop}
+        results = tmp_path / "results.json"
+        results.write_text(
+            '{"config": ' + json.dumps(data["config"]) + ",\n"
+            ' "runs": ' + json.dumps(data["runs"]) + "}\n",
+            encoding="utf-8",
+        )
+
+        result = runner.invoke(cli, ["analyze", "--results", str(results)])
+        assert result.exit_code == 0, result.output
+        output = _extract_json(result.output)
+        assert output["ranking"][0]["component"] == "retriever"
+        assert output["component_importance"]["retriever"] == pytest.approx(0.2)
+
     def test_analyze_jsonl_format(
         self, runner: CliRunner, tmp_path: Path
     ) -> None:
@@ -216,21 +221,158 @@ class TestAnalyzeCommand:
         output = _extract_json(result.output)
         assert "ranking" in output
 
+    def test_analyze_jsonl_skips_blank_lines(
+        self, runner: CliRunner, tmp_path: Path
+    ) -> None:
+        runs = [
+            {"run_id": "baseline-abc", "disabled_component": None, "metrics": {"accuracy": 0.9}},
+            {"run_id": "ablate-ret-xyz", "disabled_component": "ret", "components": [{"name": "ret", "enabled": False}], "metrics": {"accuracy": 0.7}},
+        ]
+        jsonl_path = tmp_path / "results.jsonl"
+        jsonl_path.write_text(
+            "\n\n" + "\n\n".join(json.dumps(r) for r in runs) + "\n", encoding="utf-8"
+        )
+        result = runner.invoke(
+            cli, ["analyze", "--results", str(jsonl_path)]
+        )
+        assert result.exit_code == 0, result.output
+        output = _extract_json(result.output)
+        assert output["component_importance"] == {"ret": 0.2}
+
+    def test_analyze_jsonl_with_nan_metric(
+        self, runner: CliRunner, tmp_path: Path
+    ) -> None:
+        runs = [
+            {"run_id": "baseline-abc", "components": [{"name": "ret"}], "metrics": {"accuracy": 0.9, "loss": float("nan")}},
+            {"run_id": "ablate-ret-xyz", "disabled_component": "ret", "components": [{"name": "ret", "enabled": False}], "metrics": {"accuracy": 0.7}},
+        ]
+        jsonl_path = tmp_path / "results.jsonl"
+        # json.dumps writes the NaN literal by default
+        jsonl_path.write_text("\n".join(json.dumps(r) for r in runs), encoding="utf-8")
+        result = runner.invoke(cli, ["analyze", "--results", str(jsonl_path)])
+        assert result.exit_code == 0, result.output
+        assert "ret" in _extract_json(result.output)["component_importance"]
+
+    def test_analyze_jsonl_with_separate_config(
+        self, config_json: Path, tmp_path: Path
+    ) -> None:
+        runs = [
+            {"run_id": "baseline-abc", "metrics": {"accuracy": 0.9}},
+            {"run_id": "ablate-retriever-xyz", "disabled_component": "retriever", "metrics": {"accuracy": 0.6}},
+            {"run_id": "ablate-reranker-xyz", "disabled_component": "reranker", "metrics": {"accuracy": 0.8}},
+        ]
+        jsonl_path = tmp_path / "results.jsonl"
+        jsonl_path.write_text("\n".join(json.dumps(r) for r in runs), encoding="utf-8")
+        output = json.loads(
+            analyze_impl(str(jsonl_path), config_path=str(config_json))
+        )
+        assert [r["component"] for r in output["ranking"]] == ["retriever", "reranker"]
+
+    def test_analyze_jsonl_with_nan_separate_config(
+        self, config_json: Path, tmp_path: Path
+    ) -> None:
+        """A ``--config`` file holding NaN parses with or without orjson."""
+        data = json.loads(config_json.read_bytes())
+        data["config"]["base_components"][0]["config"] = {"temperature": float("nan")}
+        nan_config = tmp_path / "nan_config.json"
+        nan_config.write_text(json.dumps(data), encoding="utf-8")
+        assert "NaN" in nan_config.read_text(encoding="utf-8")
+
+        runs = [
+            {"run_id": "baseline-abc", "metrics": {"accuracy": 0.9}},
+            {"run_id": "ablate-retriever-xyz", "disabled_component": "retriever", "metrics": {"accuracy": 0.6}},
+        ]
+        jsonl_path = tmp_path / "results.jsonl"
+        jsonl_path.write_text("\n".join(json.dumps(r) for r in runs), encoding="utf-8")
+        output = json.loads(analyze_impl(str(jsonl_path), config_path=str(nan_config)))
+        assert output["component_importance"]["retriever"] == pytest.approx(0.3)
+
     def test_analyze_writes_output_file(
-        self, runner: CliRunner, config_json: Path, tmp_path: Path
+        self, config_json: Path, tmp_path: Path
     ) -> None:
-        data = json.loads(config_json.read_text(encoding="utf-8"))
+        config_json = Path(shutil.copy(config_json, tmp_path / "cfg.json"))
+        data = json.loads(config_json.read_bytes())
         for run in data["runs"]:
             run["metrics"] = {"accuracy": 0.9}
-        config_json.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        # Compact, single-line document: exercises the non-indented JSON path
+        config_json.write_text(
+            json.dumps(data, separators=(",", ":")), encoding="utf-8"
+        )
 
         output_path = tmp_path / "analysis.json"
-        result = runner.invoke(
-            cli,
-            ["analyze", "--results", str(config_json), "--output", str(output_path)],
-        )
-        assert result.exit_code == 0, result.output
-        assert output_path.exists()
+        json_output = analyze_impl(str(config_json), str(output_path))
+        assert output_path.read_bytes() == json_output
+
+    def test_analyze_json_without_runs_fails(
+        self, runner: CliRunner, tmp_path: Path
+    ) -> None:
+        json_path = tmp_path / "results.json"
+        json_path.write_text(json.dumps({"config": {}}, indent=2), encoding="utf-8")
+        result = runner.invoke(cli, ["analyze", "--results", str(json_path)])
+        assert result.exit_code != 0
+        assert "'config' and 'runs'" in result.output
+
+    def test_analyze_compact_json_without_runs_fails(
+        self, runner: CliRunner, tmp_path: Path
+    ) -> None:
+        json_path = tmp_path / "results.json"
+        json_path.write_text(json.dumps({"config": {}}), encoding="utf-8")
+        result = runner.invoke(cli, ["analyze", "--results", str(json_path)])
+        assert result.exit_code == 1
+        assert "'config' and 'runs'" in result.output
+
+    def test_analyze_impl_raises_click_exception(self, tmp_path: Path) -> None:
+        json_path = tmp_path / "results.json"
+        json_path.write_text(json.dumps({"runs": []}), encoding="utf-8")
+        with pytest.raises(click.ClickException, match="'config' and 'runs'"):
+            analyze_impl(str(json_path))
+
+    def test_cli_without_orjson(
+        self,
+        config_json: Path,
+        components_json: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        import aumai_ablation.cli as cli_module
+
+        config_json = Path(shutil.copy(config_json, tmp_path / "cfg.json"))
+        data = json.loads(config_json.read_bytes())
+        for run in data["runs"]:
+            run["metrics"] = {"accuracy": 0.9}
+        config_json.write_text(json.dumps(data), encoding="utf-8")
+
+        with_orjson = analyze_impl(str(config_json))
+        monkeypatch.setattr(cli_module, "_orjson", None)
+        stdlib_only = analyze_impl(str(config_json))
+        assert json.loads(stdlib_only) == json.loads(with_orjson)
+        assert stdlib_only.startswith(b"{\n  ")
+
+        # JSON components manifest is parsed by the stdlib fallback too
+        runs = configure_impl(str(components_json), "accuracy", str(tmp_path / "c.json"))
+        assert len(runs) == 3
+
+    def test_nan_importance_written_as_null(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """orjson and the stdlib fallback both write a NaN score as ``null``."""
+        import aumai_ablation.cli as cli_module
+
+        runs = [
+            {"run_id": "baseline-abc", "components": [{"name": "ret"}], "metrics": {"loss": float("nan")}},
+            {"run_id": "ablate-ret-xyz", "disabled_component": "ret", "components": [{"name": "ret", "enabled": False}], "metrics": {"loss": 0.5}},
+        ]
+        jsonl_path = tmp_path / "results.jsonl"
+        jsonl_path.write_text("\n".join(json.dumps(r) for r in runs), encoding="utf-8")
+
+        outputs = [analyze_impl(str(jsonl_path))]
+        monkeypatch.setattr(cli_module, "_orjson", None)
+        outputs.append(analyze_impl(str(jsonl_path)))
+        for output in outputs:
+            assert b"NaN" not in output
+            data = json.loads(output)
+            assert data["component_importance"] == {"ret": None}
+            assert data["ranking"] == [{"component": "ret", "importance": None}]
 
     def test_analyze_missing_results_fails(self, runner: CliRunner) -> None:
         result = runner.invoke(
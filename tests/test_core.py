@@ -32,6 +32,10 @@ class TestAblationStudyConfigure:
         assert "accuracy" in config.metrics_to_track
         assert "latency_ms" in config.metrics_to_track
 
+    def test_configure_callable_on_class(self, two_components) -> None:
+        config = AblationStudy.configure(components=two_components, metrics=["accuracy"])
+        assert isinstance(config, AblationConfig)
+
     def test_configure_default_repetitions(self, two_components) -> None:
         study = AblationStudy()
         config = study.configure(components=two_components, metrics=["accuracy"])
@@ -108,13 +112,26 @@ class TestAblationStudyGenerateRuns:
         # Only 1 ablation run for the active component
         assert len(runs) == 2
 
-    def test_generate_runs_components_are_deep_copies(self, basic_config) -> None:
+    def test_generate_runs_components_are_independent_copies(self, basic_config) -> None:
         study = AblationStudy()
         runs = study.generate_runs(basic_config)
         # Mutating a run's component should not affect another run
         runs[1].components[0].enabled = False
         assert runs[0].components[0].enabled is True
 
+    def test_generate_runs_component_configs_are_independent(
+        self, basic_config
+    ) -> None:
+        runs = AblationStudy.generate_runs(basic_config)
+        runs[1].components[0].config["top_k"] = 99
+        assert runs[0].components[0].config == {"top_k": 5}
+        assert basic_config.base_components[0].config == {"top_k": 5}
+
+    def test_generate_runs_leaves_base_components_enabled(self, basic_config) -> None:
+        study = AblationStudy()
+        study.generate_runs(basic_config)
+        assert all(c.enabled for c in basic_config.base_components)
+
 
 # ---------------------------------------------------------------------------
 # AblationStudy.compute_importance tests
@@ -142,6 +159,26 @@ class TestAblationStudyComputeImportance:
         # Reranker: baseline_avg=95 vs ablated_avg=90, delta=5
         assert importance["retriever"] > importance["reranker"]
 
+    def test_compute_importance_pools_repeated_runs(self, basic_config) -> None:
+        runs = [
+            AblationRun(run_id="baseline-1", metrics={"accuracy": 0.90}),
+            AblationRun(run_id="baseline-2", metrics={"accuracy": 0.80}),
+            AblationRun(
+                run_id="ablate-retriever-1",
+                disabled_component="retriever",
+                metrics={"accuracy": 0.70},
+            ),
+            AblationRun(
+                run_id="ablate-retriever-2",
+                disabled_component="retriever",
+                metrics={"accuracy": 0.50},
+            ),
+        ]
+        result = AblationResult(config=basic_config, runs=runs)
+        importance = AblationStudy.compute_importance(result)
+        # baseline mean 0.85, ablated mean 0.60
+        assert importance == {"retriever": pytest.approx(0.25)}
+
     def test_compute_importance_no_baseline_returns_empty(self, basic_config) -> None:
         runs = [
             AblationRun(
@@ -208,3 +245,12 @@ class TestAblationStudyRankComponents:
         ranking = study.rank_components(result)
         # No metrics → importance is empty → ranking is empty
         assert ranking == []
+
+    def test_rank_components_uses_subclass_importance(self, completed_result) -> None:
+        class FixedStudy(AblationStudy):
+            @staticmethod
+            def compute_importance(result: AblationResult) -> dict[str, float]:
+                return {"x": 42.0}
+
+        assert FixedStudy.rank_components(completed_result) == [("x", 42.0)]
+        assert completed_result.component_importance == {"x": 42.0}